@@ -9,11 +9,34 @@ Enter API Keys below and run script!
 import requests
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import re
 
+try:
+    import orjson  # faster JSON parsing when installed
+except ImportError:
+    orjson = None
+
+
+def parse_json(response):
+    """Parse a response body, using orjson when available."""
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def write_json(path, config):
+    """Serialize config straight to path without an intermediate string."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(config))
+    else:
+        with open(path, 'wt', buffering=1 << 20) as f:
+            json.dump(config, f)
+
 
 server = 'https://www.cradlepointecm.com/api/v2'
 
@@ -31,12 +54,17 @@ exponentially increasing backoff of 1s, 2s, 4s, and so on... It
 will retry on basic connectivity issues and the listed HTTP
 status codes. """
 
+# Characters not allowed in backup file names
+_sanitize_re = re.compile(r'[\\/*?:"<>|]')
+
 session = requests.session()
 retries = Retry(total=10,  # Total number of retries to allow.
                 backoff_factor=1,
                 status_forcelist=[408, 429, 502, 503, 504],
                 )
-session.mount('https://', HTTPAdapter(max_retries=retries))
+session.mount('https://', HTTPAdapter(max_retries=retries,
+                                      pool_connections=20,
+                                      pool_maxsize=20))
 
 # Get root account name for backup directory name
 accounts_url = f'{server}/accounts/'
@@ -44,7 +72,7 @@ while accounts_url:
     get_accounts = session.get(accounts_url, headers=api_keys)
     accounts_url = None
     if get_accounts.status_code < 300:
-        get_accounts = get_accounts.json()
+        get_accounts = parse_json(get_accounts)
         try:
             account_name = get_accounts["data"][0]["name"]
             accounts_url = get_accounts["data"][0]["account"]
@@ -71,41 +99,52 @@ print('\n¸,ø¤°º¤ø,¸¸,ø¤º°`°  NCM Config Backup  °º¤ø,¸¸,ø¤
 print(f'Creating Backups Here: \n{my_backup_dir}/\n')
 print('Backing up device configurations...\n')
 
+def fetch_and_write_config(router):
+    """Fetch one router's config and write it to the backup directory.
+
+    Returns True if a config file was written.
+    """
+    config_url = f'{server}/configuration_managers/?router=' \
+        f'{router["id"]}'
+    get_config = session.get(config_url, headers=api_keys)
+    if get_config.status_code < 300:
+        get_config = parse_json(get_config)
+        try:
+            config = get_config["data"][0]["configuration"]
+            if include_blank_configs or config != [{}, []]:
+                router_name = _sanitize_re.sub("_", router["name"])
+                write_json(f'{routers_dir}/{router["id"]} - '
+                           f'{router_name}.json', config)
+                print(f'Backed up config for router : {router["id"]} - '
+                      f'{router["name"]}')
+                return True
+        except Exception as e:
+            print(f'Exception backing up config for {router["id"]} - '
+                  f'{router["name"]}: {e}')
+    else:
+        print(f'Error getting config for {router["id"]} - '
+              f'{router["name"]}: {get_config.text}')
+    return False
+
+
 routers_backed_up = 0
 routers_url = f'{server}/routers/'
-while routers_url:
-    get_routers = session.get(routers_url, headers=api_keys)
-    if get_routers.status_code < 300:
-        get_routers = get_routers.json()
-        routers = get_routers["data"]
-        routers = [x for x in routers if x["state"] != "initialized"]
-        for router in routers:
-            config_url = f'{server}/configuration_managers/?router=' \
-                f'{router["id"]}'
-            get_config = session.get(config_url, headers=api_keys)
-            if get_config.status_code < 300:
-                get_config = get_config.json()
-                try:
-                    config = get_config["data"][0]["configuration"]
-                    if include_blank_configs or config != [{}, []]:
-                        router_name = re.sub(r'[\\/*?:"<>|]', "_",
-                                             router["name"])
-                        with open(f'{routers_dir}/{router["id"]} - '
-                                  f'{router_name}.json', 'wt') as f:
-                            f.write(json.dumps(config))
-                        print(f'Backed up config for router : {router["id"]} - '
-                              f'{router["name"]}')
-                        routers_backed_up += 1
-                except Exception as e:
-                    print(f'Exception backing up config for {router["id"]} - '
-                          f'{router["name"]}: {e}')
-            else:
-                print(f'Error getting config for {router["id"]} - '
-                      f'{router["name"]}: {get_config.text}')
-        routers_url = get_routers["meta"]["next"]
-    else:
-        print(f'Error getting routers: {get_routers.text}')
-        break
+with ThreadPoolExecutor(max_workers=16) as executor:
+    while routers_url:
+        get_routers = session.get(routers_url, headers=api_keys)
+        if get_routers.status_code < 300:
+            get_routers = parse_json(get_routers)
+            routers = get_routers["data"]
+            routers = [x for x in routers if x["state"] != "initialized"]
+            futures = [executor.submit(fetch_and_write_config, router)
+                       for router in routers]
+            for future in as_completed(futures):
+                if future.result():
+                    routers_backed_up += 1
+            routers_url = get_routers["meta"]["next"]
+        else:
+            print(f'Error getting routers: {get_routers.text}')
+            break
 
 print(f'\nBacked up {routers_backed_up} router configurations.')
 
@@ -116,15 +155,14 @@ groups_url = f'{server}/groups/'
 while groups_url:
     get_groups = session.get(groups_url, headers=api_keys)
     if get_groups.status_code < 300:
-        get_groups = get_groups.json()
+        get_groups = parse_json(get_groups)
         groups = get_groups["data"]
         for group in groups:
             config = group["configuration"]
             if include_blank_configs or config != [{}, []]:
-                group_name = re.sub(r'[\\/*?:"<>|]', "_", group["name"])
-                with open(f'{groups_dir}/{group["id"]} - {group_name}.json',
-                          'wt') as f:
-                    f.write(json.dumps(config))
+                group_name = _sanitize_re.sub("_", group["name"])
+                write_json(f'{groups_dir}/{group["id"]} - {group_name}.json',
+                           config)
                 print(f'Backed up config for group : {group["id"]} - '
                       f'{group["name"]}')
                 groups_backed_up += 1
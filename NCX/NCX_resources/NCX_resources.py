@@ -1,6 +1,12 @@
 # NCX_resources - Create an NCX IP Subnet resource for all LANs on all routers in specified group
 from ncm import ncm
+import functools
 import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+
+# Fleets reuse the same LAN subnets on many routers, so cache the parse.
+parse_network = functools.lru_cache(maxsize=4096)(
+    functools.partial(ipaddress.ip_network, strict=False))
 
 # NCM Group ID of routers to create resources for
 group_id = 'NCM Group ID'
@@ -41,26 +47,32 @@ def get_lans(router):
         return []
     lans = []
     for lan in r.json():
-        network = ipaddress.ip_network(f"{lan['ip_address']}/{lan['netmask']}", strict=False)
+        network = parse_network(f"{lan['ip_address']}/{lan['netmask']}")
         lans.append(str(network))
     return lans
 
+def create_resources(router):
+    print(f'Creating NCX resources for router {router["id"]} {router["name"]}...')
+    site = get_site(router)
+    lans = get_lans(router)
+    if not lans:
+        print("No lans found")
+        return
+    for lan in lans:
+        resource = n.create_exchange_resource(site['id'], f"{lan}", "exchange_ipsubnet_resources", ip=lan)
+        if isinstance(resource, str):
+            if not "overlapping_resource" in resource:
+                print(resource)
+                continue
+        print(f'Created NCX IP Subnet Resource {lan} for router {router["name"]}, site {site["name"]}.')
+    print('Success!\n')
+
 routers = n.get_routers(group=group_id, limit='all')
 if not routers:
     print(f'No routers found!')
 else:
-    for router in routers:
-        print(f'Creating NCX resources for router {router["id"]} {router["name"]}...')
-        site = get_site(router)
-        lans = get_lans(router)
-        if not lans:
-            print("No lans found")
-            continue
-        for lan in lans:
-            resource = n.create_exchange_resource(site['id'], f"{lan}", "exchange_ipsubnet_resources", ip=lan)
-            if isinstance(resource, str):
-                if not "overlapping_resource" in resource:
-                    print(resource)
-                    continue
-            print(f'Created NCX IP Subnet Resource {lan} for router {router["name"]}, site {site["name"]}.')
-        print('Success!\n')
+    # Each router's site lookup, LAN fetch, and resource creates are
+    # independent, so run them concurrently on the shared client.
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        for _ in executor.map(create_resources, routers):
+            pass
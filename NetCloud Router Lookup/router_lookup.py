@@ -1,9 +1,20 @@
 from flask import Flask, request, jsonify, send_from_directory
 import requests
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # faster JSON parsing when installed
+except ImportError:
+    orjson = None
 
 app = Flask("router_lookup")
 
+# Shared session so lookups reuse keep-alive connections across requests
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
 # Dictionary of named keys
 named_keys = {
     'account1': {
@@ -44,14 +55,31 @@ def get_router_info():
         if len(user_input) != 12:
             return jsonify({"result": "Invalid serial number or MAC address"}), 200
 
-    results = {}
-    for account_name, api_keys in named_keys.items():
-        url = f'https://www.cradlepointecm.com/api/v2/routers/?{filter_type}={user_input}'
-        response = requests.get(url, headers=api_keys)
+    url = f'https://www.cradlepointecm.com/api/v2/routers/?{filter_type}={user_input}'
+
+    def lookup(account_name, api_keys):
+        response = SESSION.get(url, headers=api_keys)
         if response.status_code == 200:
-            response_json = response.json()
+            if orjson:
+                response_json = orjson.loads(response.content)
+            else:
+                response_json = response.json()
             if response_json.get("data"):
+                return account_name
+        return None
+
+    # The per-account lookups are independent, so run them all at once
+    # and answer as soon as any account reports a match.
+    executor = ThreadPoolExecutor(max_workers=len(named_keys))
+    try:
+        futures = [executor.submit(lookup, account_name, api_keys)
+                   for account_name, api_keys in named_keys.items()]
+        for future in as_completed(futures):
+            account_name = future.result()
+            if account_name:
                 return jsonify({"result": f"Account Name: {account_name}"}), 200
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     return jsonify({"result": "No router found"}), 200
 
@@ -22,8 +22,64 @@
 
 import requests
 import csv
+import functools
+import hashlib
+import json
+import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+try:
+    import orjson  # faster JSON serialization when installed
+except ImportError:
+    orjson = None
+
+
+def dump_json(obj):
+    """Serialize obj to JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def parse_json(response):
+    """Parse a response body, using orjson when available."""
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
 
 csv_file = 'routers.csv'
+
+# Digest of the last payload successfully applied to each router, so
+# re-running the script after a small csv edit only patches the routers
+# whose values actually changed.
+cache_file = '.bulk_config_cache.json'
+
+
+def load_cache():
+    """Return the {router_id: payload digest} map from the last run."""
+    try:
+        with open(cache_file, 'rt') as f:
+            return {int(k): v for k, v in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    """Write the digest map atomically so a crash can't corrupt it."""
+    tmp = cache_file + '.tmp'
+    with open(tmp, 'wt') as f:
+        json.dump({str(k): v for k, v in cache.items()}, f)
+    os.replace(tmp, cache_file)
+
+
+# Routers are patched in waves of BATCH_SIZE with a BATCH_DELAY-second
+# pause between waves to stay under NCM's rate limits; tune per account.
+BATCH_SIZE = 100
+BATCH_DELAY = 3
 api_keys = {
     'X-ECM-API-ID': 'YOUR',
     'X-ECM-API-KEY': 'KEYS',
@@ -71,6 +127,24 @@ def build_config(column):
     # > > > Replace config values with corresponding csv column letters  < < <
 
 
+# Column letters precomputed once; position 1 in a row is column "B"
+_COL_LETTERS = tuple(chr(c) for c in range(ord('A'), ord('A') + 26))
+
+
+class ColumnValues(dict):
+    """Case-insensitive row mapping: column["d"] and column["D"] match.
+
+    Values are stored once under the uppercase column letter instead of
+    twice under both cases.
+    """
+
+    def __getitem__(self, key):
+        return dict.__getitem__(self, key.upper())
+
+    def get(self, key, default=None):
+        return dict.get(self, key.upper(), default)
+
+
 def load_csv(filename):
     """Return a dictionary of router_ids containing config values from csv.
 
@@ -80,46 +154,177 @@ def load_csv(filename):
     """
     router_configs = {}
     try:
-        with open(filename, 'rt') as f:
-            rows = csv.reader(f)
+        # utf-8-sig strips a BOM from spreadsheet exports; newline=''
+        # lets the csv module handle line endings itself. Blank and
+        # comment lines are dropped before the tokenizer sees them.
+        with open(filename, 'rt', encoding='utf-8-sig',
+                  buffering=1 << 20, newline='') as f:
+            rows = csv.reader(line for line in f
+                              if line.strip() and not line.startswith('#'))
             for row in rows:
-                try:
-                    router_id = int(row[0])
-                    column = {"A": router_id}
-                    i = 1
-                    while True:
-                        try:
-                            column[chr(i + 97).upper()] = row[i]
-                            column[chr(i + 97).lower()] = row[i]
-                            i += 1
-                        except:
-                            break
-                    router_configs[column["A"]] = column
-                except:
-                    pass
+                if not row:
+                    continue
+                # Validate before converting; raising and catching
+                # ValueError per bad row is far slower than a check.
+                rid = row[0].strip()
+                if not rid.isdigit():  # header or comment row
+                    print(f'Skipping csv row without a router ID: {row}')
+                    continue
+                router_id = int(rid)
+                column = ColumnValues(A=router_id)
+                # Slice to the letter table so wide rows can't overrun it
+                for i, value in enumerate(row[1:len(_COL_LETTERS)], start=1):
+                    column[_COL_LETTERS[i]] = value
+                router_configs[router_id] = column
     except Exception as e:
         print(f'Exception reading csv file: {e}')
     return router_configs
 
 
 server = 'https://www.cradlepointecm.com/api/v2'
-rows = load_csv(csv_file)
-for router_id in rows:
-    config_url = f'{server}/configuration_managers/?router={router_id}'
-    get_config = requests.get(config_url, headers=api_keys)
-    if get_config.status_code < 300:
-        get_config = get_config.json()
-        config_data = get_config["data"]
+
+# Bodies are passed pre-encoded via data=, so declare the content type
+patch_headers = {**api_keys, 'Content-Type': 'application/json'}
+
+class LowLatencyAdapter(HTTPAdapter):
+    """HTTPAdapter that disables Nagle's algorithm on its connections.
+
+    Small PATCH bodies are sent immediately instead of sitting in the
+    socket buffer waiting for ACK coalescing, and keep-alive probes stop
+    idle pooled connections from being dropped mid-run.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+# One session shared by all workers so every request reuses the same
+# keep-alive connection pool instead of opening a new TLS connection.
+# Backoff honors the server's Retry-After header on 429, so the worker
+# pool paces itself to whatever rate NCM is willing to serve.
+session = requests.Session()
+# PATCH is not in urllib3's default allowed_methods, so list it
+# explicitly; the config PATCH bodies are idempotent and safe to resend.
+retries = Retry(total=5,
+                backoff_factor=1,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'PATCH']),
+                respect_retry_after_header=True,
+                )
+session.mount('https://', LowLatencyAdapter(max_retries=retries,
+                                            pool_connections=16,
+                                            pool_maxsize=32))
+
+
+@functools.lru_cache(maxsize=4096)
+def build_config_bytes(frozen_columns):
+    """Return the encoded PATCH body for a row's column values.
+
+    Fleets commonly share one profile across many routers, so rows with
+    identical values reuse the same pre-encoded body instead of
+    rebuilding and re-serializing it per router. The router ID column
+    ("A") is excluded from the cache key; the pasted config should
+    reference the device-specific columns (B onward), not the ID used to
+    address the PATCH.
+    """
+    column = ColumnValues(frozen_columns)
+    return dump_json({"configuration": build_config(column)})
+
+
+def load_config_ids(router_ids):
+    """Return a dictionary mapping router ID to configuration_manager ID.
+
+    Queries configuration_managers/ with router__in filters in chunks of
+    100 (the NCM filter limit), so only the routers listed in the csv
+    are fetched rather than every configuration_manager on the account.
+    """
+    config_ids = {}
+    router_ids = list(router_ids)
+    for i in range(0, len(router_ids), 100):
+        chunk = ','.join(str(x) for x in router_ids[i:i + 100])
+        url = (f'{server}/configuration_managers/?router__in={chunk}'
+               f'&fields=id,router&limit=100')
+        while url:
+            resp = session.get(url, headers=api_keys)
+            if resp.status_code >= 300:
+                print(f'Error listing configuration_managers/: {resp.text}')
+                break
+            resp = parse_json(resp)
+            for item in resp["data"]:
+                router = item["router"]
+                if isinstance(router, str):  # router is a resource URL
+                    router = int(router.rstrip('/').rsplit('/', 1)[-1])
+                config_ids[router] = item["id"]
+            url = resp["meta"]["next"]
+    return config_ids
+
+
+def patch_one(router_id):
+    """Look up the configuration_manager for router_id and patch its config.
+
+    :param router_id: router ID from the csv file
+    :type router_id: int
+    :return: True if the config was patched successfully
+    """
+    body = build_config_bytes(tuple(sorted(
+        (k, v) for k, v in rows[router_id].items() if k != "A")))
+    digest = hashlib.sha256(body).hexdigest()
+    if applied.get(router_id) == digest:
+        print(f'Config unchanged since last run, skipping: {router_id}')
+        return True
+    config_id = config_ids.get(router_id)
+    if config_id is None:  # cache miss - fall back to per-router lookup
+        config_url = f'{server}/configuration_managers/?router={router_id}'
+        get_config = session.get(config_url, headers=api_keys)
+        if get_config.status_code >= 300:
+            print(f'Error getting configuration_managers/ ID for {router_id}: '
+                  f'{get_config.text}')
+            return False
+        config_data = parse_json(get_config)["data"]
+        if not config_data:
+            print(f'No configuration_manager found for router: {router_id}')
+            return False
         config_id = config_data[0]["id"]
-        config = build_config(rows[router_id])
-        patch_config = requests.patch(f'{server}/configuration_managers/'
-                                      f'{config_id}/', headers=api_keys,
-                                      json={"configuration": config})
-        if patch_config.status_code < 300:
-            print(f'Sucessfully patched config to router: {router_id}')
-        else:
-            print(f'Error patching config {router_id}: {patch_config.text}')
+    patch_config = session.patch(f'{server}/configuration_managers/'
+                                 f'{config_id}/', headers=patch_headers,
+                                 data=body)
+    if patch_config.status_code < 300:
+        print(f'Sucessfully patched config to router: {router_id}')
+        applied[router_id] = digest
+        return True
     else:
-        print(f'Error getting configuration_managers/ ID for {router_id}: '
-              f'{get_config.text}')
-print('Done!')
+        print(f'Error patching config {router_id}: {patch_config.text}')
+    return False
+
+
+# Populated by main(); patch_one reads these from worker threads
+rows = {}
+config_ids = {}
+applied = {}
+
+
+def main():
+    global rows, config_ids, applied
+    rows = load_csv(csv_file)
+    config_ids = load_config_ids(rows)
+    applied = load_cache()
+    router_ids = list(rows)
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for i in range(0, len(router_ids), BATCH_SIZE):
+                results.extend(executor.map(patch_one,
+                                            router_ids[i:i + BATCH_SIZE]))
+                if i + BATCH_SIZE < len(router_ids):
+                    time.sleep(BATCH_DELAY)
+    finally:
+        save_cache(applied)
+    print(f'Done! Patched {sum(results)} of {len(results)} routers.')
+
+
+if __name__ == '__main__':
+    main()
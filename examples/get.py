@@ -3,6 +3,12 @@ import json
 import logging
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # ~3-6x faster than stdlib json and parses bytes directly
+except ImportError:
+    orjson = None
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 from datetime import datetime
@@ -18,31 +24,31 @@ headers = {
 
 class NcmAPIv2(object):
 
+    # Retry policy and adapter are built once and shared by every
+    # instance; the adapter owns the keep-alive connection pool, so
+    # backoff state is not reset between pages.
+    _retry = Retry(total=5,  # Total number of retries to allow.
+                   backoff_factor=2,
+                   status_forcelist=[408,  # 408 Request Timeout
+                                     500,  # 500 Internal Server Error
+                                     502,  # 502 Bad Gateway
+                                     503,  # 503 Service Unavailable
+                                     504,  # 504 Gateway Timeout
+                                     ],
+                   )
+    _adapter = HTTPAdapter(max_retries=_retry,
+                           pool_connections=10,
+                           pool_maxsize=10)
+
     def __init__(self):
-        self.resp_data = {'data': []}
-
-    @staticmethod
-    def establish_session():
-        with requests.Session() as session:
-            retries = Retry(total=5,  # Total number of retries to allow.
-                            backoff_factor=2,
-                            status_forcelist=[408,  # 408 Request Timeout
-                                              500,  # 500 Internal Server Error
-                                              502,  # 502 Bad Gateway
-                                              503,  # 503 Service Unavailable
-                                              504,  # 504 Gateway Timeout
-                                              ],
-                            )
-            a = HTTPAdapter(max_retries=retries)
-            session.mount('https://', a)
-
-        return session
+        # One session for the life of the instance so every paginated
+        # request reuses the same keep-alive connection pool instead of
+        # paying a new TCP+TLS handshake per page.
+        self.session = requests.Session()
+        self.session.mount('https://', self._adapter)
 
     def next_url(self):
 
-        for item in self.resp['data']:
-            self.resp_data['data'].append(item)
-
         if args.page and self.resp['meta']['next']:
             self.url = self.resp['meta']['next']
             return self.url
@@ -55,39 +61,65 @@ class NcmAPIv2(object):
 
     def get_data(self, get_url, json_output):
 
-        session = self.establish_session()
+        # Items are written out page by page, so peak memory is bounded
+        # by a single page rather than the entire walk. The
+        # single-worker executor fetches page N+1 while page N is still
+        # being processed, hiding one round-trip per page.
+        with open(f'json/{json_output}', 'w', buffering=1 << 20) as outfile, \
+                ThreadPoolExecutor(max_workers=1) as executor:
 
-        while get_url:
+            outfile.write('{"data": [')
+            items_written = 0
+            future_next = None
 
-            logging.info(get_url)
-
-            try:
-                r = session.get(get_url, headers=headers,
-                                timeout=30, stream=True)
+            while get_url:
 
-                if r.status_code != 200:
-                    logging.info(str(r.status_code) + ": " + str(r.text))
-                    break
+                logging.info(get_url)
 
-                else:
-                    self.resp = json.loads(r.content.decode("utf-8"))
+                try:
+                    if future_next is not None:
+                        r = future_next.result()
+                        future_next = None
+                    else:
+                        r = self.session.get(get_url, headers=headers,
+                                             timeout=30, stream=True)
 
-                    if len(self.resp['data']) < 1:
-                        return self.resp
+                    if r.status_code != 200:
+                        logging.info(str(r.status_code) + ": " + str(r.text))
+                        break
 
                     else:
-                        get_url = self.next_url()
+                        if orjson:
+                            self.resp = orjson.loads(r.content)
+                        else:
+                            self.resp = json.loads(r.content)
+
+                        if len(self.resp['data']) < 1:
+                            break
+
+                        # The next URL is known as soon as the page
+                        # arrives, so start fetching it before the
+                        # current page is processed.
+                        if self.resp['meta']['next']:
+                            future_next = executor.submit(
+                                self.session.get, self.resp['meta']['next'],
+                                headers=headers, timeout=30, stream=True)
+
+                        for item in self.resp['data']:
+                            if items_written:
+                                outfile.write(', ')
+                            json.dump(item, outfile)
+                            items_written += 1
 
-            except Exception as e:
-                logging.info("Exception:", e)
-                raise
+                        get_url = self.next_url()
 
-        json_data = json.dumps(self.resp_data, indent=4, sort_keys=False)
+                except Exception as e:
+                    logging.info("Exception:", e)
+                    raise
 
-        with open(f'json/{json_output}', 'w') as outfile:
-            outfile.write(json_data)
+            outfile.write(']}')
 
-        return json_data
+        return items_written
 
 
 if __name__ == '__main__':
@@ -57,6 +57,11 @@ import sys
 import os
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def __is_json(test_json):
     """
@@ -69,6 +74,15 @@ def __is_json(test_json):
     return True
 
 
+def _json_dumps(obj):
+    """
+    Serializes a request body, using orjson when available.
+    """
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
+
+
 class BaseNcmClient:
     def __init__(self,
                  log_events=True,
@@ -101,7 +115,9 @@ class BaseNcmClient:
                               backoff_factor=retry_backoff_factor,
                               status_forcelist=retry_on,
                               redirect=3
-                              )
+                              ),
+            pool_connections=10,
+            pool_maxsize=20
         )
         self.base_url = base_url
         self.session.mount(self.base_url, self.adapter)
@@ -224,11 +240,14 @@ class NcmClientv2(BaseNcmClient):
                             ncm = self.session.get(url, params=params)
                             if not (200 <= ncm.status_code < 300):
                                 break
+                            # Parse the body once per page; ncm.json()
+                            # re-decodes the full payload on every call.
+                            resp = ncm.json()
                             self._return_handler(ncm.status_code,
-                                                  ncm.json()['data'],
+                                                  resp['data'],
                                                   call_type)
-                            url = ncm.json()['meta']['next']
-                            for d in ncm.json()['data']:
+                            url = resp['meta']['next']
+                            for d in resp['data']:
                                 results.append(d)
 
         if __in_keys == 0:
@@ -237,10 +256,11 @@ class NcmClientv2(BaseNcmClient):
                 ncm = self.session.get(url, params=params)
                 if not (200 <= ncm.status_code < 300):
                     break
-                self._return_handler(ncm.status_code, ncm.json()['data'],
+                resp = ncm.json()
+                self._return_handler(ncm.status_code, resp['data'],
                                       call_type)
-                url = ncm.json()['meta']['next']
-                for d in ncm.json()['data']:
+                url = resp['meta']['next']
+                for d in resp['data']:
                     results.append(d)
         return results
 
@@ -339,7 +359,7 @@ class NcmClientv2(BaseNcmClient):
             'name': str(subaccount_name)
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(post_data))
+        ncm = self.session.post(post_url, data=_json_dumps(post_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -368,7 +388,7 @@ class NcmClientv2(BaseNcmClient):
             "name": str(new_subaccount_name)
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -524,7 +544,7 @@ class NcmClientv2(BaseNcmClient):
         ncm = self.session.patch(
             '{0}/configuration_managers/{1}/'.format(self.base_url,
                                                      str(config_man_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
 
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
@@ -571,7 +591,7 @@ class NcmClientv2(BaseNcmClient):
 
         ncm = self.session.patch(
             '{0}/groups/{1}/'.format(self.base_url, str(group_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -589,7 +609,7 @@ class NcmClientv2(BaseNcmClient):
 
         ncm = self.session.put(
             '{0}/groups/{1}/'.format(self.base_url, str(group_id)),
-            data=json.dumps(payload))  # put group config with new values
+            data=_json_dumps(payload))  # put group config with new values
         result = self.__return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -824,18 +844,18 @@ class NcmClientv2(BaseNcmClient):
         call_type = 'Group'
         post_url = '{0}/groups/'.format(self.base_url)
 
-        firmware = self.get_firmware_for_product_name_by_version(
-            product_name, firmware_version)
+        product = self.get_product_by_name(product_name)
+        firmware = self.get_firmware_for_product_id_by_version(
+            product['id'], firmware_version)
 
         post_data = {
             'account': '/api/v1/accounts/{}/'.format(str(parent_account_id)),
             'name': str(group_name),
-            'product': str(
-                self.get_product_by_name(product_name)['resource_url']),
+            'product': str(product['resource_url']),
             'target_firmware': str(firmware['resource_url'])
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(post_data))
+        ncm = self.session.post(post_url, data=_json_dumps(post_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -870,7 +890,7 @@ class NcmClientv2(BaseNcmClient):
             "name": str(new_group_name)
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -1004,7 +1024,7 @@ class NcmClientv2(BaseNcmClient):
                 .format(str(router_id))
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(post_data))
+        ncm = self.session.post(post_url, data=_json_dumps(post_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -1231,7 +1251,7 @@ class NcmClientv2(BaseNcmClient):
             'router': '{0}/routers/{1}/'.format(self.base_url, str(router_id))
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(post_data))
+        ncm = self.session.post(post_url, data=_json_dumps(post_data))
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -1248,7 +1268,7 @@ class NcmClientv2(BaseNcmClient):
             'group': '{0}/groups/{1}/'.format(self.base_url, str(group_id))
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(post_data))
+        ncm = self.session.post(post_url, data=_json_dumps(post_data))
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -1541,7 +1561,7 @@ class NcmClientv2(BaseNcmClient):
             'name': str(new_router_name)
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -1572,7 +1592,7 @@ class NcmClientv2(BaseNcmClient):
                 group_id)
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -1596,7 +1616,7 @@ class NcmClientv2(BaseNcmClient):
             "group": None
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         if ncm.status_code == 201 or ncm.status_code == 202:
             self.log('info', 'Router Modified Successfully')
             return None
@@ -1620,7 +1640,7 @@ class NcmClientv2(BaseNcmClient):
                     account_id)
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -1687,7 +1707,7 @@ class NcmClientv2(BaseNcmClient):
             }
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(post_data))
+        ncm = self.session.post(post_url, data=_json_dumps(post_data))
         if ncm.status_code == 201:
             return ncm.json()
         else:
@@ -1801,7 +1821,7 @@ class NcmClientv2(BaseNcmClient):
         ncm = self.session.patch(
             '{0}/configuration_managers/{1}/'.format(self.base_url,
                                                      str(config_man_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -1820,7 +1840,7 @@ class NcmClientv2(BaseNcmClient):
             "custom1": str(text)
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -1839,7 +1859,7 @@ class NcmClientv2(BaseNcmClient):
             "custom2": str(text)
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -1879,7 +1899,7 @@ class NcmClientv2(BaseNcmClient):
         ncm = self.session.patch(
             '{0}/configuration_managers/{1}/'.format(self.base_url,
                                                      str(config_man_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -1915,7 +1935,7 @@ class NcmClientv2(BaseNcmClient):
         ncm = self.session.patch(
             '{0}/configuration_managers/{1}/'.format(self.base_url,
                                                      str(config_man_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -1951,7 +1971,7 @@ class NcmClientv2(BaseNcmClient):
         ncm = self.session.patch(
             '{0}/configuration_managers/{1}/'.format(self.base_url,
                                                      str(config_man_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -1987,7 +2007,7 @@ class NcmClientv2(BaseNcmClient):
         ncm = self.session.patch(
             '{0}/configuration_managers/{1}/'.format(self.base_url,
                                                      str(config_man_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -2040,7 +2060,7 @@ class NcmClientv2(BaseNcmClient):
         ncm = self.session.patch(
             '{0}/configuration_managers/{1}/'.format(self.base_url,
                                                      str(config_man_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -2090,7 +2110,7 @@ class NcmClientv2(BaseNcmClient):
         ncm = self.session.patch(
             '{0}/configuration_managers/{1}/'.format(self.base_url,
                                                      str(config_man_id)),
-            data=json.dumps(payload))  # Patch indie config with new values
+            data=_json_dumps(payload))  # Patch indie config with new values
         result = self._return_handler(ncm.status_code, ncm.text, call_type)
         return result
 
@@ -2114,7 +2134,7 @@ class NcmClientv2(BaseNcmClient):
             if v is not None:
                 put_data[k] = v
 
-        ncm = self.session.put(put_url, data=json.dumps(put_data))
+        ncm = self.session.put(put_url, data=_json_dumps(put_data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -2366,7 +2386,7 @@ class NcmClientv3(BaseNcmClient):
             }
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(data))
+        ncm = self.session.post(post_url, data=_json_dumps(data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -2399,7 +2419,7 @@ class NcmClientv3(BaseNcmClient):
 
         user = {"data": user}
 
-        ncm = self.session.put(put_url, data=json.dumps(user))
+        ncm = self.session.put(put_url, data=_json_dumps(user))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -2642,7 +2662,7 @@ class NcmClientv3(BaseNcmClient):
 
         data = {"data": net}
 
-        ncm = self.session.put(put_url, data=json.dumps(data))
+        ncm = self.session.put(put_url, data=_json_dumps(data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -2692,7 +2712,7 @@ class NcmClientv3(BaseNcmClient):
 
             data['data']['relationships'] = relationships
 
-        ncm = self.session.post(post_url, data=json.dumps(data))
+        ncm = self.session.post(post_url, data=_json_dumps(data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -2935,7 +2955,7 @@ class NcmClientv3(BaseNcmClient):
 
         radio = {"data": radio}
 
-        ncm = self.session.put(put_url, data=json.dumps(radio))
+        ncm = self.session.put(put_url, data=_json_dumps(radio))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -3052,7 +3072,7 @@ class NcmClientv3(BaseNcmClient):
 
         group = {"data": group}
 
-        ncm = self.session.put(put_url, data=json.dumps(group))
+        ncm = self.session.put(put_url, data=_json_dumps(group))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -3093,7 +3113,7 @@ class NcmClientv3(BaseNcmClient):
 
             group['data']['relationships'] = relationships
 
-        ncm = self.session.post(post_url, data=json.dumps(group))
+        ncm = self.session.post(post_url, data=_json_dumps(group))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -3230,7 +3250,7 @@ class NcmClientv3(BaseNcmClient):
 
         sim = {"data": sim}
 
-        ncm = self.session.put(put_url, data=json.dumps(sim))
+        ncm = self.session.put(put_url, data=_json_dumps(sim))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         return result
 
@@ -3520,7 +3540,7 @@ class NcmClientv3(BaseNcmClient):
             }
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(data))
+        ncm = self.session.post(post_url, data=_json_dumps(data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         if ncm.status_code == 201:
             return ncm.json()['data']
@@ -3627,7 +3647,7 @@ class NcmClientv3(BaseNcmClient):
             }
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(data))
+        ncm = self.session.put(put_url, data=_json_dumps(data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         if ncm.status_code == 200:
             return ncm.json()['data']
@@ -3913,7 +3933,7 @@ class NcmClientv3(BaseNcmClient):
             }
         }
 
-        ncm = self.session.post(post_url, data=json.dumps(data))
+        ncm = self.session.post(post_url, data=_json_dumps(data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         if ncm.status_code == 201:
             return ncm.json()['data']
@@ -4028,7 +4048,7 @@ class NcmClientv3(BaseNcmClient):
             }
         }
 
-        ncm = self.session.put(put_url, data=json.dumps(data))
+        ncm = self.session.put(put_url, data=_json_dumps(data))
         result = self._return_handler(ncm.status_code, ncm.json(), call_type)
         if ncm.status_code == 200:
             return ncm.json()['data']
@@ -202,11 +202,14 @@ class NcmClient:
                             ncm = self.session.get(url, params=params)
                             if not (200 <= ncm.status_code < 300):
                                 break
+                            # Parse the body once per page; ncm.json()
+                            # re-decodes the full payload on every call.
+                            resp = ncm.json()
                             self.__return_handler(ncm.status_code,
-                                                  ncm.json()['data'],
+                                                  resp['data'],
                                                   call_type)
-                            url = ncm.json()['meta']['next']
-                            for d in ncm.json()['data']:
+                            url = resp['meta']['next']
+                            for d in resp['data']:
                                 results.append(d)
 
         if __in_keys == 0:
@@ -215,10 +218,11 @@ class NcmClient:
                 ncm = self.session.get(url, params=params)
                 if not (200 <= ncm.status_code < 300):
                     break
-                self.__return_handler(ncm.status_code, ncm.json()['data'],
+                resp = ncm.json()
+                self.__return_handler(ncm.status_code, resp['data'],
                                       call_type)
-                url = ncm.json()['meta']['next']
-                for d in ncm.json()['data']:
+                url = resp['meta']['next']
+                for d in resp['data']:
                     results.append(d)
         return results
 